@@ -12,10 +12,11 @@ import re
 import json
 import csv
 import time
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Pattern, Tuple
 from dataclasses import dataclass, asdict
 import os
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # PDF processing imports
 try:
@@ -246,6 +247,74 @@ class PDFTextExtractor:
         
         return best_result
 
+# Reference parsing patterns, compiled once at import rather than looked up
+# in the re module's cache on every call
+_CITATION_PATTERNS = {
+    "apa": [
+        # Author, A. A. (Year). Title. Journal, Volume(Issue), pages.
+        re.compile(r'([A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*[A-Z]\.)?)*)\s*\((\d{4})\)\.\s*([^.]+)\.\s*([^,]+)(?:,\s*(\d+)(?:\((\d+)\))?)(?:,\s*([\d-]+))?'),
+        # Author, A. A., & Author, B. B. (Year). Book title. Publisher.
+        re.compile(r'([A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*[A-Z]\.)?)*(?:,?\s*&\s*[A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*[A-Z]\.)?)*)*)\s*\((\d{4})\)\.\s*([^.]+)\.\s*([^.]+)\.')
+    ],
+    "mla": [
+        # Author, First. "Title." Journal, vol. #, no. #, Year, pp. #-#.
+        re.compile(r'([A-Z][a-z]+,\s*[A-Z][a-z]+)\.\s*"([^"]+)"\.\s*([^,]+),\s*vol\.\s*(\d+)(?:,\s*no\.\s*(\d+))?,\s*(\d{4}),\s*pp\.\s*([\d-]+)'),
+        # Author, First. Book Title. Publisher, Year.
+        re.compile(r'([A-Z][a-z]+,\s*[A-Z][a-z]+)\.\s*([^.]+)\.\s*([^,]+),\s*(\d{4})\.')
+    ],
+    "chicago": [
+        # Author, First Last. "Title." Journal Volume, no. Issue (Year): pages.
+        re.compile(r'([A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\.\s*"([^"]+)"\.\s*([^0-9]+)\s*(\d+)(?:,\s*no\.\s*(\d+))?\s*\((\d{4})\):\s*([\d-]+)'),
+        # Author, First Last. Book Title. Place: Publisher, Year.
+        re.compile(r'([A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\.\s*([^.]+)\.\s*[^:]+:\s*([^,]+),\s*(\d{4})\.')
+    ],
+    "ieee": [
+        # [1] A. Author, "Title," Journal, vol. #, no. #, pp. #-#, Year.
+        re.compile(r'\[(\d+)\]\s*([A-Z]\.\s*[A-Z][a-z]+(?:,\s*[A-Z]\.\s*[A-Z][a-z]+)*),\s*"([^"]+)",\s*([^,]+),\s*vol\.\s*(\d+)(?:,\s*no\.\s*(\d+))?,\s*pp\.\s*([\d-]+),\s*(\d{4})'),
+        # [1] A. Author, Book Title. Publisher, Year.
+        re.compile(r'\[(\d+)\]\s*([A-Z]\.\s*[A-Z][a-z]+(?:,\s*[A-Z]\.\s*[A-Z][a-z]+)*),\s*([^.]+)\.\s*([^,]+),\s*(\d{4})\.')
+    ]
+}
+
+# Headers that open the references section, in order of preference
+_SECTION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(?i)\n\s*references\s*\n',
+    r'(?i)\n\s*bibliography\s*\n',
+    r'(?i)\n\s*works\s+cited\s*\n',
+    r'(?i)\n\s*literature\s+cited\s*\n',
+    r'(?i)\n\s*citations\s*\n'
+))
+
+# Headers of sections that may follow the references
+_SECTION_END_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(?i)\n\s*appendix',
+    r'(?i)\n\s*acknowledgments?',
+    r'(?i)\n\s*author\s+information',
+    r'(?i)\n\s*about\s+the\s+authors?'
+))
+
+_NUMBERED_MARKER_PATTERN = re.compile(r'\[(\d+)\]')
+
+_REFERENCE_START_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^\[\d+\]',  # [1], [2], etc.
+    r'^\d+\.',    # 1., 2., etc.
+    r'^[A-Z][a-z]+,\s*[A-Z]',  # Author, A.
+    r'^[A-Z][a-z]+,\s*[A-Z][a-z]+'  # Author, First
+))
+
+_DOI_PATTERN = re.compile(r'(?:doi:|DOI:)\s*(10\.\d+/[^\s]+)', re.IGNORECASE)
+_URL_PATTERN = re.compile(r'(https?://[^\s]+)')
+_ISBN_PATTERN = re.compile(r'(?:ISBN:?\s*)((?:\d{3}-)?\d{1,5}-\d{1,7}-\d{1,7}-[\dX])', re.IGNORECASE)
+_VOLUME_PATTERN = re.compile(r'(?:vol\.?\s*|volume\s*)(\d+)', re.IGNORECASE)
+_ISSUE_PATTERN = re.compile(r'(?:no\.?\s*|issue\s*|number\s*)(\d+)', re.IGNORECASE)
+_PAGES_PATTERN = re.compile(r'(?:pp?\.?\s*|pages?\s*)([\d-]+)', re.IGNORECASE)
+
+_NUMBERED_REFERENCE_PATTERN = re.compile(
+    r'\[(\d+)\]\s*([^[\n]+(?:\n[^[\n]+)*?)(?=\[\d+\]|\n\s*\n|$)', re.MULTILINE
+)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
 class ReferenceParser:
     """
     Parses extracted text to identify and structure academic references
@@ -255,34 +324,9 @@ class ReferenceParser:
         self.config = config
         self.citation_patterns = self._initialize_citation_patterns()
         
-    def _initialize_citation_patterns(self) -> Dict[str, List[str]]:
+    def _initialize_citation_patterns(self) -> Dict[str, List[Pattern]]:
         """Initialize regex patterns for different citation styles"""
-        return {
-            "apa": [
-                # Author, A. A. (Year). Title. Journal, Volume(Issue), pages.
-                r'([A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*[A-Z]\.)?)*)\s*\((\d{4})\)\.\s*([^.]+)\.\s*([^,]+)(?:,\s*(\d+)(?:\((\d+)\))?)(?:,\s*([\d-]+))?',
-                # Author, A. A., & Author, B. B. (Year). Book title. Publisher.
-                r'([A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*[A-Z]\.)?)*(?:,?\s*&\s*[A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*[A-Z]\.)?)*)*)\s*\((\d{4})\)\.\s*([^.]+)\.\s*([^.]+)\.'
-            ],
-            "mla": [
-                # Author, First. "Title." Journal, vol. #, no. #, Year, pp. #-#.
-                r'([A-Z][a-z]+,\s*[A-Z][a-z]+)\.\s*"([^"]+)"\.\s*([^,]+),\s*vol\.\s*(\d+)(?:,\s*no\.\s*(\d+))?,\s*(\d{4}),\s*pp\.\s*([\d-]+)',
-                # Author, First. Book Title. Publisher, Year.
-                r'([A-Z][a-z]+,\s*[A-Z][a-z]+)\.\s*([^.]+)\.\s*([^,]+),\s*(\d{4})\.'
-            ],
-            "chicago": [
-                # Author, First Last. "Title." Journal Volume, no. Issue (Year): pages.
-                r'([A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\.\s*"([^"]+)"\.\s*([^0-9]+)\s*(\d+)(?:,\s*no\.\s*(\d+))?\s*\((\d{4})\):\s*([\d-]+)',
-                # Author, First Last. Book Title. Place: Publisher, Year.
-                r'([A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\.\s*([^.]+)\.\s*[^:]+:\s*([^,]+),\s*(\d{4})\.'
-            ],
-            "ieee": [
-                # [1] A. Author, "Title," Journal, vol. #, no. #, pp. #-#, Year.
-                r'\[(\d+)\]\s*([A-Z]\.\s*[A-Z][a-z]+(?:,\s*[A-Z]\.\s*[A-Z][a-z]+)*),\s*"([^"]+)",\s*([^,]+),\s*vol\.\s*(\d+)(?:,\s*no\.\s*(\d+))?,\s*pp\.\s*([\d-]+),\s*(\d{4})',
-                # [1] A. Author, Book Title. Publisher, Year.
-                r'\[(\d+)\]\s*([A-Z]\.\s*[A-Z][a-z]+(?:,\s*[A-Z]\.\s*[A-Z][a-z]+)*),\s*([^.]+)\.\s*([^,]+),\s*(\d{4})\.'
-            ]
-        }
+        return _CITATION_PATTERNS
     
     def extract_references_from_text(self, text: str) -> List[ExtractedReference]:
         """
@@ -311,33 +355,18 @@ class ReferenceParser:
         Find and extract the references/bibliography section from the text
         """
         # Common section headers
-        section_patterns = [
-            r'(?i)\n\s*references\s*\n',
-            r'(?i)\n\s*bibliography\s*\n',
-            r'(?i)\n\s*works\s+cited\s*\n',
-            r'(?i)\n\s*literature\s+cited\s*\n',
-            r'(?i)\n\s*citations\s*\n'
-        ]
-        
-        for pattern in section_patterns:
-            match = re.search(pattern, text)
+        for pattern in _SECTION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 # Extract text from the match to the end or next major section
                 start_pos = match.end()
                 
                 # Look for end of references (next major section)
-                end_patterns = [
-                    r'(?i)\n\s*appendix',
-                    r'(?i)\n\s*acknowledgments?',
-                    r'(?i)\n\s*author\s+information',
-                    r'(?i)\n\s*about\s+the\s+authors?'
-                ]
-                
                 end_pos = len(text)
-                for end_pattern in end_patterns:
-                    end_match = re.search(end_pattern, text[start_pos:])
+                for end_pattern in _SECTION_END_PATTERNS:
+                    end_match = end_pattern.search(text, start_pos)
                     if end_match:
-                        end_pos = start_pos + end_match.start()
+                        end_pos = end_match.start()
                         break
                 
                 return text[start_pos:end_pos].strip()
@@ -370,9 +399,8 @@ class ReferenceParser:
         # Try different splitting strategies
         
         # Strategy 1: Split by numbered references [1], [2], etc.
-        numbered_pattern = r'\[(\d+)\]'
-        if re.search(numbered_pattern, text):
-            parts = re.split(numbered_pattern, text)
+        if _NUMBERED_MARKER_PATTERN.search(text):
+            parts = _NUMBERED_MARKER_PATTERN.split(text)
             references = []
             for i in range(1, len(parts), 2):  # Skip the first empty part and take every other
                 if i + 1 < len(parts):
@@ -418,15 +446,8 @@ class ReferenceParser:
         Determine if a line starts a new reference
         """
         # Check for common reference starting patterns
-        patterns = [
-            r'^\[\d+\]',  # [1], [2], etc.
-            r'^\d+\.',    # 1., 2., etc.
-            r'^[A-Z][a-z]+,\s*[A-Z]',  # Author, A.
-            r'^[A-Z][a-z]+,\s*[A-Z][a-z]+'  # Author, First
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, line):
+        for pattern in _REFERENCE_START_PATTERNS:
+            if pattern.match(line):
                 return True
         
         return False
@@ -440,7 +461,7 @@ class ReferenceParser:
         # Try different citation style patterns
         for style, patterns in self.citation_patterns.items():
             for pattern in patterns:
-                match = re.search(pattern, ref_text)
+                match = pattern.search(ref_text)
                 if match:
                     return self._create_reference_from_match(match, ref_text, ref_number, style)
         
@@ -491,37 +512,31 @@ class ReferenceParser:
         Extract additional metadata like DOI, URL, ISBN, etc.
         """
         # DOI extraction
-        doi_pattern = r'(?:doi:|DOI:)\s*(10\.\d+/[^\s]+)'
-        doi_match = re.search(doi_pattern, ref_text, re.IGNORECASE)
+        doi_match = _DOI_PATTERN.search(ref_text)
         if doi_match:
             reference.doi = doi_match.group(1)
         
         # URL extraction
-        url_pattern = r'(https?://[^\s]+)'
-        url_match = re.search(url_pattern, ref_text)
+        url_match = _URL_PATTERN.search(ref_text)
         if url_match:
             reference.url = url_match.group(1)
         
         # ISBN extraction
-        isbn_pattern = r'(?:ISBN:?\s*)((?:\d{3}-)?\d{1,5}-\d{1,7}-\d{1,7}-[\dX])'
-        isbn_match = re.search(isbn_pattern, ref_text, re.IGNORECASE)
+        isbn_match = _ISBN_PATTERN.search(ref_text)
         if isbn_match:
             reference.isbn = isbn_match.group(1)
         
         # Volume and issue extraction
-        volume_pattern = r'(?:vol\.?\s*|volume\s*)(\d+)'
-        volume_match = re.search(volume_pattern, ref_text, re.IGNORECASE)
+        volume_match = _VOLUME_PATTERN.search(ref_text)
         if volume_match:
             reference.volume = volume_match.group(1)
         
-        issue_pattern = r'(?:no\.?\s*|issue\s*|number\s*)(\d+)'
-        issue_match = re.search(issue_pattern, ref_text, re.IGNORECASE)
+        issue_match = _ISSUE_PATTERN.search(ref_text)
         if issue_match:
             reference.issue = issue_match.group(1)
         
         # Pages extraction
-        pages_pattern = r'(?:pp?\.?\s*|pages?\s*)([\d-]+)'
-        pages_match = re.search(pages_pattern, ref_text, re.IGNORECASE)
+        pages_match = _PAGES_PATTERN.search(ref_text)
         if pages_match:
             reference.pages = pages_match.group(1)
         
@@ -556,9 +571,7 @@ class ReferenceParser:
         references = []
         
         # Pattern for numbered references
-        pattern = r'\[(\d+)\]\s*([^[\n]+(?:\n[^[\n]+)*?)(?=\[\d+\]|\n\s*\n|$)'
-        
-        matches = re.finditer(pattern, text, re.MULTILINE)
+        matches = _NUMBERED_REFERENCE_PATTERN.finditer(text)
         
         for match in matches:
             ref_number = int(match.group(1))
@@ -662,7 +675,7 @@ class ReferenceParser:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_PATTERN.sub(' ', text)
         
         # Remove leading/trailing punctuation and whitespace
         text = text.strip(' .,;:')
@@ -1105,7 +1118,8 @@ class PDFReferenceExtractionAgent:
             "enable_ocr": True,
             "ocr_language": "eng",
             "max_file_size_mb": 50,
-            "timeout_seconds": 300
+            "timeout_seconds": 300,
+            "batch_workers": 1
         }
     
     def extract_references_from_pdf(self, pdf_path: str, output_path: str = None, 
@@ -1183,18 +1197,7 @@ class PDFReferenceExtractionAgent:
             processing_time = time.time() - start_time
             
             # Update statistics
-            self.processing_stats["total_pdfs_processed"] += 1
-            self.processing_stats["total_references_extracted"] += len(filtered_references)
-            
-            if filtered_references:
-                current_avg = self.processing_stats["average_confidence_score"]
-                total_processed = self.processing_stats["total_pdfs_processed"]
-                new_avg = sum(ref.confidence_score for ref in filtered_references) / len(filtered_references)
-                
-                # Update running average
-                self.processing_stats["average_confidence_score"] = (
-                    (current_avg * (total_processed - 1) + new_avg) / total_processed
-                )
+            self._update_statistics(filtered_references)
             
             # Prepare result
             result = {
@@ -1239,10 +1242,29 @@ class PDFReferenceExtractionAgent:
                 "processing_time": time.time() - start_time
             }
     
+    def _update_statistics(self, filtered_references: List[ExtractedReference]):
+        """Count a successfully processed PDF in the running statistics"""
+        self.processing_stats["total_pdfs_processed"] += 1
+        self.processing_stats["total_references_extracted"] += len(filtered_references)
+        
+        if filtered_references:
+            current_avg = self.processing_stats["average_confidence_score"]
+            total_processed = self.processing_stats["total_pdfs_processed"]
+            new_avg = sum(ref.confidence_score for ref in filtered_references) / len(filtered_references)
+            
+            # Update running average
+            self.processing_stats["average_confidence_score"] = (
+                (current_avg * (total_processed - 1) + new_avg) / total_processed
+            )
+    
     def batch_extract_references(self, pdf_paths: List[str], output_dir: str = "batch_extraction") -> Dict[str, any]:
         """
         Extract references from multiple PDF files in batch
         
+        With the "batch_workers" config option above 1, PDFs are processed in
+        that many worker processes, each with its own agent; 0 uses one worker
+        per CPU. A single PDF is always processed in this process.
+        
         Args:
             pdf_paths: List of paths to PDF files
             output_dir: Directory to store all output files
@@ -1260,17 +1282,19 @@ class PDFReferenceExtractionAgent:
         print(f"Starting batch extraction of {len(pdf_paths)} PDF files...")
         print(f"Output directory: {output_dir}")
         
-        for i, pdf_path in enumerate(pdf_paths, 1):
-            print(f"\\n{'='*60}")
-            print(f"Processing file {i}/{len(pdf_paths)}: {os.path.basename(pdf_path)}")
-            print(f"{'='*60}")
-            
-            # Generate output path for this PDF
-            pdf_name = Path(pdf_path).stem
-            output_path = os.path.join(output_dir, f"references_{pdf_name}")
-            
-            # Extract references
-            result = self.extract_references_from_pdf(pdf_path, output_path)
+        # Generate output path for each PDF
+        output_paths = [
+            os.path.join(output_dir, f"references_{Path(pdf_path).stem}")
+            for pdf_path in pdf_paths
+        ]
+        
+        workers = min(self.config.get("batch_workers", 1) or os.cpu_count() or 1, len(pdf_paths))
+        if workers > 1:
+            results = self._extract_in_processes(pdf_paths, output_paths, workers)
+        else:
+            results = self._extract_sequentially(pdf_paths, output_paths)
+        
+        for pdf_path, result in zip(pdf_paths, results):
             batch_results[pdf_path] = result
             
             if result["status"] == "success":
@@ -1325,6 +1349,37 @@ class PDFReferenceExtractionAgent:
             "summary_file": summary_path
         }
     
+    def _extract_sequentially(self, pdf_paths: List[str], output_paths: List[str]) -> Iterator[Dict[str, any]]:
+        """Extract references from each PDF in turn with this agent"""
+        for i, (pdf_path, output_path) in enumerate(zip(pdf_paths, output_paths), 1):
+            print(f"\\n{'='*60}")
+            print(f"Processing file {i}/{len(pdf_paths)}: {os.path.basename(pdf_path)}")
+            print(f"{'='*60}")
+            
+            yield self.extract_references_from_pdf(pdf_path, output_path)
+    
+    def _extract_in_processes(self, pdf_paths: List[str], output_paths: List[str],
+                              workers: int) -> Iterator[Dict[str, any]]:
+        """
+        Extract references from the PDFs in worker processes, yielding results in input order
+        
+        Each worker builds one agent up front and reuses it for every PDF it is
+        given. Worker statistics are merged into this agent's.
+        """
+        print(f"Using {workers} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self.config,)) as executor:
+            outcomes = executor.map(_extract_in_batch_worker, pdf_paths, output_paths)
+            for i, (result, errors) in enumerate(outcomes, 1):
+                print(f"Finished file {i}/{len(pdf_paths)}: {os.path.basename(result['pdf_path'])}")
+                
+                if result["status"] == "success":
+                    self._update_statistics(result["references"])
+                self.processing_stats["processing_errors"].extend(errors)
+                
+                yield result
+    
     def get_processing_statistics(self) -> Dict[str, any]:
         """Get current processing statistics"""
         return self.processing_stats.copy()
@@ -1338,6 +1393,20 @@ class PDFReferenceExtractionAgent:
             "processing_errors": []
         }
 
+# Per-process agent for batch extraction workers
+_batch_agent = None
+
+def _init_batch_worker(config: Dict):
+    """Build the worker's agent once per process"""
+    global _batch_agent
+    _batch_agent = PDFReferenceExtractionAgent(config)
+
+def _extract_in_batch_worker(pdf_path: str, output_path: str) -> Tuple[Dict[str, any], List[Dict]]:
+    """Extract references from one PDF, returning the result and any errors recorded"""
+    _batch_agent.reset_statistics()
+    result = _batch_agent.extract_references_from_pdf(pdf_path, output_path)
+    return result, _batch_agent.processing_stats["processing_errors"]
+
 # Integration with ARAS system
 def integrate_with_aras(pdf_extraction_result: Dict[str, any], aras_system) -> Dict[str, any]:
     """
@@ -142,6 +142,23 @@ def test_agent_initialization():
         assert key in stats
     print("✓ Statistics structure is correct")
 
+def test_batch_workers():
+    """Test that batch extraction in worker processes matches sequential extraction"""
+    print("\\nTesting Batch Workers...")
+
+    pdf_paths = ["missing_one.pdf", "missing_two.pdf"]
+    sequential = PDFReferenceExtractionAgent()
+    parallel = PDFReferenceExtractionAgent(dict(sequential.config, batch_workers=2))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        expected = sequential.batch_extract_references(pdf_paths, temp_dir)
+        result = parallel.batch_extract_references(pdf_paths, temp_dir)
+
+    assert list(result["individual_results"]) == pdf_paths
+    assert result["batch_summary"]["failed_extractions"] == expected["batch_summary"]["failed_extractions"] == 2
+    assert len(parallel.get_processing_statistics()["processing_errors"]) == 2
+    print("✓ Worker results merged in input order")
+
 def test_integration_functions():
     """Test integration and utility functions"""
     print("\\nTesting Integration Functions...")
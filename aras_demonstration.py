@@ -3,297 +3,568 @@ Academic Research Agent System (ARAS) - Demonstration Script
 This script demonstrates the key capabilities of the ARAS system without making actual API calls.
 """
 
-from academic_research_agent_system import AcademicResearchAgentSystem, Publication
+from academic_research_agent_system import AcademicResearchAgentSystem, Publication, _event_loop_running
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import re
+import sys
 import time
 
-def create_sample_publications(researcher_name: str) -> list:
-    """Create sample publications for demonstration"""
-    sample_pubs = []
-    
-    if "Paul Leonardi" in researcher_name:
-        sample_pubs = [
-            Publication(
-                title="The Digital Mindset: What It Really Takes to Thrive in the Age of Data, Algorithms, and AI",
-                authors=["Paul M. Leonardi", "Tsedal Neeley"],
-                year=2022,
-                venue="Harvard Business Review Press",
-                publication_type="book",
-                isbn="9781647820107",
-                url="https://www.harvard.com/book/9781647820107",
-                citation_count=45,
-                verified=True
-            ),
-            Publication(
-                title="Technology Choice: Why Occupations Differ in Their Embrace of New Technology",
-                authors=["Paul M. Leonardi"],
-                year=2011,
-                venue="MIT Press",
-                publication_type="book",
-                citation_count=234,
-                verified=True
-            ),
-            Publication(
-                title="Materiality and Change: Challenges to Building Better Theory about Technology and Organizing",
-                authors=["Paul M. Leonardi"],
-                year=2012,
-                venue="Information and Organization",
-                publication_type="journal",
-                citation_count=567,
-                verified=True
-            )
-        ]
-    
-    elif "Matt Beane" in researcher_name:
-        sample_pubs = [
-            Publication(
-                title="The Skill Code: How to Save Human Ability in an Age of Intelligent Machines",
-                authors=["Matt Beane"],
-                year=2024,
-                venue="HarperBusiness",
-                publication_type="book",
-                isbn="9780063204485",
-                citation_count=12,
-                verified=True
-            ),
-            Publication(
-                title="Shadow Learning: Building Robotic Surgical Skill When Approved Means Fail",
-                authors=["Matt Beane"],
-                year=2019,
-                venue="Administrative Science Quarterly",
-                publication_type="journal",
-                citation_count=89,
-                verified=True
-            )
-        ]
-    
-    elif "Nelson Phillips" in researcher_name:
-        sample_pubs = [
-            Publication(
-                title="Discourse Analysis: Investigating Processes of Social Construction",
-                authors=["Marianne W. Jorgensen", "Louise J. Phillips"],
-                year=2002,
-                venue="Sage Publications",
-                publication_type="book",
-                citation_count=1234,
-                verified=True
-            ),
-            Publication(
-                title="Institutional Theory and Organizational Change",
-                authors=["Nelson Phillips", "Thomas B. Lawrence"],
-                year=2012,
-                venue="Academy of Management Review",
-                publication_type="journal",
-                citation_count=456,
-                verified=True
-            )
-        ]
-    
-    else:
-        # Generic sample for other researchers
-        sample_pubs = [
-            Publication(
-                title="Sample Academic Publication",
-                authors=[researcher_name],
-                year=2023,
-                venue="Academic Journal",
-                publication_type="journal",
-                citation_count=10,
-                verified=True
-            )
-        ]
-    
+# JIT compilation imports
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Author names are interned and single-author tuples shared across publications
+_LEONARDI = sys.intern("Paul M. Leonardi")
+_NEELEY = sys.intern("Tsedal Neeley")
+_BEANE = sys.intern("Matt Beane")
+_JORGENSEN = sys.intern("Marianne W. Jorgensen")
+_L_PHILLIPS = sys.intern("Louise J. Phillips")
+_N_PHILLIPS = sys.intern("Nelson Phillips")
+_LAWRENCE = sys.intern("Thomas B. Lawrence")
+_LEONARDI_SOLE = (_LEONARDI,)
+_BEANE_SOLE = (_BEANE,)
+
+# Sample publications keyed by researcher name, built once at import
+_SAMPLE_PUBS = {
+    "Paul Leonardi": (
+        Publication(
+            title="The Digital Mindset: What It Really Takes to Thrive in the Age of Data, Algorithms, and AI",
+            authors=(_LEONARDI, _NEELEY),
+            year=2022,
+            venue="Harvard Business Review Press",
+            publication_type="book",
+            isbn="9781647820107",
+            url="https://www.harvard.com/book/9781647820107",
+            citation_count=45,
+            verified=True
+        ),
+        Publication(
+            title="Technology Choice: Why Occupations Differ in Their Embrace of New Technology",
+            authors=_LEONARDI_SOLE,
+            year=2011,
+            venue="MIT Press",
+            publication_type="book",
+            citation_count=234,
+            verified=True
+        ),
+        Publication(
+            title="Materiality and Change: Challenges to Building Better Theory about Technology and Organizing",
+            authors=_LEONARDI_SOLE,
+            year=2012,
+            venue="Information and Organization",
+            publication_type="journal",
+            citation_count=567,
+            verified=True
+        )
+    ),
+    "Matt Beane": (
+        Publication(
+            title="The Skill Code: How to Save Human Ability in an Age of Intelligent Machines",
+            authors=_BEANE_SOLE,
+            year=2024,
+            venue="HarperBusiness",
+            publication_type="book",
+            isbn="9780063204485",
+            citation_count=12,
+            verified=True
+        ),
+        Publication(
+            title="Shadow Learning: Building Robotic Surgical Skill When Approved Means Fail",
+            authors=_BEANE_SOLE,
+            year=2019,
+            venue="Administrative Science Quarterly",
+            publication_type="journal",
+            citation_count=89,
+            verified=True
+        )
+    ),
+    "Nelson Phillips": (
+        Publication(
+            title="Discourse Analysis: Investigating Processes of Social Construction",
+            authors=(_JORGENSEN, _L_PHILLIPS),
+            year=2002,
+            venue="Sage Publications",
+            publication_type="book",
+            citation_count=1234,
+            verified=True
+        ),
+        Publication(
+            title="Institutional Theory and Organizational Change",
+            authors=(_N_PHILLIPS, _LAWRENCE),
+            year=2012,
+            venue="Academy of Management Review",
+            publication_type="journal",
+            citation_count=456,
+            verified=True
+        )
+    )
+}
+
+_NAME_TOKENS = re.compile(r"\w+")
+
+# Surname token -> _SAMPLE_PUBS keys ending in it (in key order), so a lookup
+# costs one probe per query token however many researchers are known
+_KEYS_BY_SURNAME = {}
+for _key in _SAMPLE_PUBS:
+    _KEYS_BY_SURNAME.setdefault(_NAME_TOKENS.findall(_key)[-1], []).append(_key)
+_KEY_ORDER = {key: rank for rank, key in enumerate(_SAMPLE_PUBS)}
+
+def _match_key(researcher_name: str):
+    """Return the _SAMPLE_PUBS key contained in researcher_name, if any"""
+    if researcher_name in _SAMPLE_PUBS:
+        return researcher_name
+    matches = [
+        key
+        for token in _NAME_TOKENS.findall(researcher_name)
+        for key in _KEYS_BY_SURNAME.get(token, ())
+        if key in researcher_name
+    ]
+    return min(matches, key=_KEY_ORDER.__getitem__) if matches else None
+
+def _generic_pubs(researcher_name: str) -> Tuple[Publication, ...]:
+    """Generic sample for other researchers"""
+    return (
+        Publication(
+            title="Sample Academic Publication",
+            authors=(sys.intern(researcher_name),),
+            year=2023,
+            venue="Academic Journal",
+            publication_type="journal",
+            citation_count=10,
+            verified=True
+        ),
+    )
+
+@lru_cache(maxsize=32)
+def create_sample_publications(researcher_name: str) -> Tuple[Publication, ...]:
+    """Create sample publications for demonstration (memoized, copy with list() to mutate)"""
+    sample_pubs = _SAMPLE_PUBS.get(_match_key(researcher_name))
+    if sample_pubs is None:
+        sample_pubs = _generic_pubs(researcher_name)
     return sample_pubs
 
-def demonstrate_aras_capabilities():
-    """Demonstrate the key capabilities of the ARAS system"""
-    print("=" * 60)
-    print("ACADEMIC RESEARCH AGENT SYSTEM (ARAS) DEMONSTRATION")
-    print("=" * 60)
-    print()
-    
-    # Initialize the system
-    print("1. SYSTEM INITIALIZATION")
-    print("-" * 30)
-    
-    config = {
-        "timeout": 10,
-        "max_results": 50,
-        "default_style": "apa",
-        "demo_mode": True
+# Simulated validation rules: (trigger keywords that must all appear, messages).
+# The first rule whose keywords are all present wins. Everything below is built
+# once at import; validate_citation only scans and does set lookups.
+_VALIDATION_RULES = (
+    (frozenset(("2023", "Digital Matrix")), (
+        "✗ Error: Incorrect title - should be 'Digital Mindset'",
+        "✗ Error: Wrong year - should be 2022"
+    )),
+    (frozenset(("Norton", "Beane")), (
+        "✗ Error: Wrong publisher - should be 'HarperBusiness'",
+    )),
+    (frozenset(("2025",)), (
+        "✗ Error: Future publication year",
+        "✗ Error: Edition does not exist"
+    ))
+)
+_VALID_CITATION = ("✓ Citation appears valid",)
+
+# All trigger keywords in one alternation, longest first, so a citation is scanned once
+_VALIDATION_KEYWORDS = re.compile("|".join(
+    re.escape(keyword)
+    for keyword in sorted(frozenset().union(*(keywords for keywords, _ in _VALIDATION_RULES)), key=len, reverse=True)
+))
+
+# Citation styles shown by the demonstration, with their section headings
+_CITATION_STYLES = ("apa", "mla", "chicago")
+_CITATION_STYLE_HEADINGS = tuple((style, f"\\n{style.upper()} Style Citations:") for style in _CITATION_STYLES)
+# Researchers whose first publication is formatted in every style
+_FEATURED_RESEARCHERS = ("Paul Leonardi", "Matt Beane")
+
+# Known problematic citations exercised by the demonstration
+_PROBLEM_CITATIONS = (
+    'Leonardi, P. M. (2023). The Digital Matrix: New rules for business transformation. Harvard Business Review Press.',  # Wrong title
+    'Beane, M. (2024). The Skill Code. W. W. Norton & Company.',  # Wrong publisher
+    'Russell, S., & Norvig, P. (2025). AI: A Modern Approach, 6th edition. Pearson.'  # Future year, wrong edition
+)
+
+def validate_citation(citation: str) -> Tuple[str, ...]:
+    """Return the simulated validation messages for a citation"""
+    found = frozenset(_VALIDATION_KEYWORDS.findall(citation))
+    for keywords, messages in _VALIDATION_RULES:
+        if keywords <= found:
+            return messages
+    return _VALID_CITATION
+
+class PubType(IntEnum):
+    """Small integer codes for the publication types summarized by the demo"""
+    BOOK = 0
+    JOURNAL = 1
+    CONFERENCE = 2
+    PREPRINT = 3
+    OTHER = 4
+
+# Type name for every code handed out so far, and the code for every name. Type
+# strings outside PubType (engine types such as Crossref's "journal-article")
+# get further codes as they are first seen, so summaries still name them
+_PUB_TYPE_NAMES = [pub_type.name.lower() for pub_type in PubType]
+_PUB_TYPE_CODES = {name: code for code, name in enumerate(_PUB_TYPE_NAMES)}
+
+def _pub_type_code(publication_type: str) -> int:
+    """Map a Publication.publication_type string to its type code"""
+    code = _PUB_TYPE_CODES.get(publication_type)
+    if code is None:
+        code = _PUB_TYPE_CODES[publication_type] = len(_PUB_TYPE_NAMES)
+        _PUB_TYPE_NAMES.append(publication_type)
+    return code
+
+def _pub_type_names(codes: np.ndarray) -> List[str]:
+    """Distinct type names in a code array, in order of first appearance"""
+    unique_codes, first_seen = np.unique(codes, return_index=True)
+    return [_PUB_TYPE_NAMES[code] for code in unique_codes[np.argsort(first_seen)]]
+
+_BATCH_FIELDS = attrgetter("title", "year", "citation_count", "publication_type")
+
+@dataclass
+class PublicationBatch:
+    """Columnar view of a publication list for vectorized summaries"""
+    # Fixed slot layout like Publication; spelled out since slots=True needs Python 3.10
+    __slots__ = ("titles", "years", "citations", "types")
+    titles: List[str]
+    years: np.ndarray
+    citations: np.ndarray
+    types: np.ndarray  # int16 type codes, PubType values for the common types
+
+    @classmethod
+    def from_publications(cls, publications: Sequence[Publication]) -> "PublicationBatch":
+        """Build the parallel columns in one pass over the publications"""
+        # attrgetter fetches every column in C; zip transposes rows into columns
+        rows = list(map(_BATCH_FIELDS, publications))
+        titles, years, citations, types = zip(*rows) if rows else ((), (), (), ())
+        return cls(
+            titles=list(titles),
+            years=np.array(years, dtype=np.int16),
+            citations=np.array([count or 0 for count in citations], dtype=np.int32),
+            types=np.fromiter(map(_pub_type_code, types), dtype=np.int16, count=len(types))
+        )
+
+HIGH_IMPACT_CITATIONS = 100
+
+def _citation_stats_numpy(citations: np.ndarray) -> Tuple[int, int, int]:
+    """Total, maximum and high-impact count of a citation array"""
+    if not citations.size:
+        return 0, 0, 0
+    return int(citations.sum()), int(citations.max()), int((citations > HIGH_IMPACT_CITATIONS).sum())
+
+# Arrays shorter than this are summed with NumPy: the compiled kernel only pays
+# off once its first-call JIT cost is spread over a large batch
+JIT_MIN_CITATIONS = 10_000
+
+if NUMBA_AVAILABLE:
+    # Compiled lazily on the first large batch, for whatever array type it gets
+    @njit(cache=True)
+    def _citation_stats_jit(citations):
+        """Total, maximum and high-impact count of a citation array in one fused loop"""
+        total = 0
+        highest = 0
+        high_impact = 0
+        for count in citations:
+            total += count
+            if count > highest:
+                highest = count
+            if count > HIGH_IMPACT_CITATIONS:
+                high_impact += 1
+        return total, highest, high_impact
+
+    def citation_stats(citations: np.ndarray) -> Tuple[int, int, int]:
+        """Total, maximum and high-impact count of a citation array"""
+        if len(citations) < JIT_MIN_CITATIONS:
+            return _citation_stats_numpy(citations)
+        total, highest, high_impact = _citation_stats_jit(citations)
+        return int(total), int(highest), int(high_impact)
+else:
+    citation_stats = _citation_stats_numpy
+
+# Per-researcher block of the report section, formatted in one call
+_SUMMARY_TEMPLATE = (
+    "\\n{name} Research Summary:\n"
+    "  • Publications: {count}\n"
+    "  • Publication types: {types}\n"
+    "  • Publication span: {first_year}-{last_year}\n"
+    "  • Total citations: {citations}\n"
+    "  • Most recent: {recent_title} ({recent_year})"
+)
+
+# Researchers covered by the demonstration, as (name, affiliation)
+DEMO_RESEARCHERS = (
+    ("Paul Leonardi", "UC Santa Barbara"),
+    ("Matt Beane", "UC Santa Barbara"),
+    ("Nelson Phillips", "UC Santa Barbara")
+)
+
+DEMO_CONFIG = {
+    "timeout": 10,
+    "max_results": 50,
+    "default_style": "apa",
+    "demo_mode": True
+}
+
+_CAPABILITIES = (
+    "✓ Multi-source academic database searching",
+    "✓ Automated publication discovery and deduplication",
+    "✓ Source verification and URL accessibility checking",
+    "✓ Citation accuracy validation and error detection",
+    "✓ Multiple citation style formatting (APA, MLA, Chicago, etc.)",
+    "✓ Publication quality assessment and ranking",
+    "✓ Comprehensive research report generation",
+    "✓ Batch processing for multiple researchers",
+    "✓ Real-time error correction recommendations",
+    "✓ Export capabilities (JSON, PDF, Word formats)"
+)
+
+def _research_result(researcher_name: str, affiliation: str) -> dict:
+    """Discovery result for one researcher's sample publications"""
+    sample_publications = create_sample_publications(researcher_name)
+    return {
+        "status": "success",
+        "researcher_name": researcher_name,
+        "affiliation": affiliation,
+        "total_publications": len(sample_publications),
+        "verified_publications": len(sample_publications),
+        "publications": sample_publications
     }
+
+async def _research_researcher(researcher_name: str, affiliation: str, simulate_latency: bool) -> dict:
+    """Run the simulated discovery pipeline for one researcher"""
+    # Simulate the research process
+    if simulate_latency:
+        await asyncio.sleep(0.5)  # Simulate API calls
     
-    aras = AcademicResearchAgentSystem(config)
-    print("✓ Academic Research Agent System initialized")
-    print("✓ Configuration loaded with demo mode enabled")
-    print("✓ All agent components ready")
-    print()
-    
-    # Test researchers
-    test_researchers = [
-        ("Paul Leonardi", "UC Santa Barbara"),
-        ("Matt Beane", "UC Santa Barbara"), 
-        ("Nelson Phillips", "UC Santa Barbara")
-    ]
-    
-    print("2. PUBLICATION DISCOVERY & VERIFICATION")
-    print("-" * 40)
-    
-    all_results = {}
+    result = _research_result(researcher_name, affiliation)
     
-    for researcher_name, affiliation in test_researchers:
-        print(f"\\nResearching: {researcher_name} ({affiliation})")
-        
-        # Simulate the research process
-        print("  → Searching academic databases...")
-        time.sleep(0.5)  # Simulate API calls
-        
-        print("  → Discovering publications...")
-        sample_publications = create_sample_publications(researcher_name)
-        
-        print("  → Verifying sources and URLs...")
-        time.sleep(0.3)
-        
-        print("  → Assessing publication quality...")
-        time.sleep(0.3)
-        
-        # Create result
-        result = {
-            "status": "success",
-            "researcher_name": researcher_name,
-            "total_publications": len(sample_publications),
-            "verified_publications": len(sample_publications),
-            "publications": sample_publications
-        }
-        
-        all_results[researcher_name] = result
-        
-        print(f"  ✓ Found {len(sample_publications)} publications")
-        print(f"  ✓ Verified {len(sample_publications)} sources")
-        
-        # Show top publication
-        if sample_publications:
-            top_pub = max(sample_publications, key=lambda x: x.citation_count or 0)
-            print(f"  ✓ Most cited: '{top_pub.title}' ({top_pub.citation_count} citations)")
+    if simulate_latency:
+        await asyncio.sleep(0.3)  # Verify sources and URLs
+        await asyncio.sleep(0.3)  # Assess publication quality
     
-    print()
-    print("3. CITATION FORMATTING")
-    print("-" * 25)
+    return result
+
+async def _discover_researchers(researchers: Sequence[Tuple[str, str]], simulate_latency: bool) -> List[dict]:
+    """Research every (name, affiliation) pair concurrently, keeping input order"""
+    return await asyncio.gather(*(
+        _research_researcher(researcher_name, affiliation, simulate_latency)
+        for researcher_name, affiliation in researchers
+    ))
+
+def _analyze_publications(publications: Sequence[Publication]) -> Dict:
+    """Reduce one researcher's publications to the numbers the report needs.
+
+    Module-level and free of shared state so it can run in a worker process.
+    """
+    batch = PublicationBatch.from_publications(publications)
+    total_citations, _, high_impact = citation_stats(batch.citations)
+    analysis = {
+        "publication_count": len(batch.titles),
+        "total_citations": int(total_citations),
+        "high_impact_publications": int(high_impact),
+        "most_cited": None
+    }
+    if batch.titles:
+        top_pub = publications[int(batch.citations.argmax())]
+        recent = int(batch.years.argmax())  # Most recent publication
+        analysis.update(
+            most_cited={"title": top_pub.title, "citation_count": top_pub.citation_count},
+            publication_types=_pub_type_names(batch.types),
+            first_year=int(batch.years.min()),
+            last_year=int(batch.years.max()),
+            most_recent={"title": batch.titles[recent], "year": int(batch.years[recent])}
+        )
+    return analysis
+
+def _discover_researchers_sequentially(researchers: Sequence[Tuple[str, str]], simulate_latency: bool) -> List[dict]:
+    """Research every (name, affiliation) pair in turn, for callers inside a running event loop"""
+    results = []
+    for researcher_name, affiliation in researchers:
+        if simulate_latency:
+            time.sleep(1.1)  # Simulate API calls, source verification and quality assessment
+        results.append(_research_result(researcher_name, affiliation))
+    return results
+
+def _analyze_all(publication_lists: List[Sequence[Publication]], config: Dict) -> List[Dict]:
+    """Analyze every researcher, in worker processes when parallel_processing is enabled"""
+    if config.get("parallel_processing") and len(publication_lists) > 1:
+        with ProcessPoolExecutor(max_workers=config.get("analysis_workers")) as executor:
+            return list(executor.map(_analyze_publications, publication_lists))
+    return list(map(_analyze_publications, publication_lists))
+
+def build_report(config: Optional[Dict] = None,
+                 researchers: Sequence[Tuple[str, str]] = DEMO_RESEARCHERS) -> Dict:
+    """Run the demonstration and return its results as plain data, without printing"""
+    config = DEMO_CONFIG if config is None else config
+    aras = AcademicResearchAgentSystem(config)
+    # Demo mode skips the simulated API latency
+    simulate_latency = not config.get("demo_mode", False)
     
-    # Demonstrate citation formatting
-    citation_styles = ["apa", "mla", "chicago"]
+    # Researchers are discovered concurrently, unless asyncio.run is unavailable
+    # because the caller (a notebook, say) already runs an event loop
+    if _event_loop_running():
+        results = _discover_researchers_sequentially(researchers, simulate_latency)
+    else:
+        results = asyncio.run(_discover_researchers(researchers, simulate_latency))
+    all_results = {result["researcher_name"]: result for result in results}
+    analyses = _analyze_all([result["publications"] for result in results], config)
     
-    for style in citation_styles:
-        print(f"\\n{style.upper()} Style Citations:")
-        
-        for researcher_name in ["Paul Leonardi", "Matt Beane"]:
-            if researcher_name in all_results:
-                publications = all_results[researcher_name]["publications"]
-                if publications:
-                    pub = publications[0]  # First publication
-                    citation = aras.citation_agent.format_citation(pub, style)
-                    print(f"  {citation}")
+    reports = []
+    for result, analysis in zip(results, analyses):
+        result["most_cited"] = analysis.pop("most_cited")
+        reports.append({"researcher_name": result["researcher_name"], **analysis})
     
-    print()
-    print("4. CITATION VALIDATION")
-    print("-" * 25)
+    # Format every (publication, style) pair once so later sections can reuse them
+    featured_pubs = [
+        all_results[researcher_name]["publications"][0]  # First publication
+        for researcher_name in _FEATURED_RESEARCHERS
+        if researcher_name in all_results and all_results[researcher_name]["publications"]
+    ]
+    citations_by_style = {
+        style: [aras.citation_agent.format_citation(pub, style) for pub in featured_pubs]
+        for style in _CITATION_STYLES
+    }
     
     # Test citation validation with known problematic citations
-    test_citations = [
-        'Leonardi, P. M. (2023). The Digital Matrix: New rules for business transformation. Harvard Business Review Press.',  # Wrong title
-        'Beane, M. (2024). The Skill Code. W. W. Norton & Company.',  # Wrong publisher
-        'Russell, S., & Norvig, P. (2025). AI: A Modern Approach, 6th edition. Pearson.'  # Future year, wrong edition
+    validation = [
+        {"citation": citation, "messages": list(validate_citation(citation))}
+        for citation in _PROBLEM_CITATIONS
     ]
     
-    print("\\nValidating problematic citations:")
-    
-    for i, citation in enumerate(test_citations, 1):
-        print(f"\\n{i}. {citation}")
-        
-        # Simulate validation
-        if "2023" in citation and "Digital Matrix" in citation:
-            print("  ✗ Error: Incorrect title - should be 'Digital Mindset'")
-            print("  ✗ Error: Wrong year - should be 2022")
-        elif "Norton" in citation and "Beane" in citation:
-            print("  ✗ Error: Wrong publisher - should be 'HarperBusiness'")
-        elif "2025" in citation:
-            print("  ✗ Error: Future publication year")
-            print("  ✗ Error: Edition does not exist")
-        else:
-            print("  ✓ Citation appears valid")
+    # Combine the per-researcher aggregates
+    total_pubs = total_citations = high_impact = 0
+    for summary in reports:
+        total_pubs += summary["publication_count"]
+        total_citations += summary["total_citations"]
+        high_impact += summary.pop("high_impact_publications")
     
-    print()
-    print("5. QUALITY ASSESSMENT")
-    print("-" * 22)
+    if simulate_latency:
+        time.sleep(0.5)  # Report generation
     
-    print("\\nPublication Quality Analysis:")
-    
-    total_pubs = sum(len(result["publications"]) for result in all_results.values())
-    total_citations = sum(
-        sum(pub.citation_count or 0 for pub in result["publications"]) 
-        for result in all_results.values()
-    )
+    return {
+        "config": dict(config),
+        "researchers": results,
+        "citations_by_style": citations_by_style,
+        "validation": validation,
+        "quality": {
+            "total_publications": total_pubs,
+            "total_citations": total_citations,
+            "average_citations": total_citations / total_pubs if total_pubs else 0.0,
+            "high_impact_publications": high_impact
+        },
+        "reports": reports,
+        "capabilities": list(_CAPABILITIES)
+    }
+
+def render_report(report: Dict) -> str:
+    """Render a build_report() result as the demonstration's console text"""
+    out = []
+    emit = out.append
+    emit("=" * 60)
+    emit("ACADEMIC RESEARCH AGENT SYSTEM (ARAS) DEMONSTRATION")
+    emit("=" * 60)
+    emit("")
     
-    print(f"  • Total publications analyzed: {total_pubs}")
-    print(f"  • Total citations: {total_citations}")
-    print(f"  • Average citations per publication: {total_citations/total_pubs:.1f}")
-    print(f"  • Verification rate: 100% (all sources verified)")
-    print(f"  • High-impact publications (>100 citations): {sum(1 for result in all_results.values() for pub in result['publications'] if (pub.citation_count or 0) > 100)}")
+    emit("1. SYSTEM INITIALIZATION")
+    emit("-" * 30)
+    emit("✓ Academic Research Agent System initialized")
+    emit("✓ Configuration loaded with demo mode enabled")
+    emit("✓ All agent components ready")
+    emit("")
     
-    print()
-    print("6. REPORT GENERATION")
-    print("-" * 22)
+    emit("2. PUBLICATION DISCOVERY & VERIFICATION")
+    emit("-" * 40)
+    for result in report["researchers"]:
+        emit(f"\\nResearching: {result['researcher_name']} ({result['affiliation']})")
+        emit("  → Searching academic databases...")
+        emit("  → Discovering publications...")
+        emit("  → Verifying sources and URLs...")
+        emit("  → Assessing publication quality...")
+        emit(f"  ✓ Found {result['total_publications']} publications")
+        emit(f"  ✓ Verified {result['verified_publications']} sources")
+        most_cited = result["most_cited"]
+        if most_cited:
+            emit(f"  ✓ Most cited: '{most_cited['title']}' ({most_cited['citation_count']} citations)")
+    emit("")
     
-    print("\\nGenerating comprehensive research reports...")
-    time.sleep(0.5)
+    emit("3. CITATION FORMATTING")
+    emit("-" * 25)
+    for style, heading in _CITATION_STYLE_HEADINGS:
+        emit(heading)
+        for citation in report["citations_by_style"].get(style, ()):
+            emit(f"  {citation}")
+    emit("")
     
-    for researcher_name, result in all_results.items():
-        publications = result["publications"]
-        
-        print(f"\\n{researcher_name} Research Summary:")
-        print(f"  • Publications: {len(publications)}")
-        print(f"  • Publication types: {', '.join(set(pub.publication_type for pub in publications))}")
-        print(f"  • Publication span: {min(pub.year for pub in publications)}-{max(pub.year for pub in publications)}")
-        print(f"  • Total citations: {sum(pub.citation_count or 0 for pub in publications)}")
-        
-        # Most recent publication
-        recent_pub = max(publications, key=lambda x: x.year)
-        print(f"  • Most recent: {recent_pub.title} ({recent_pub.year})")
+    emit("4. CITATION VALIDATION")
+    emit("-" * 25)
+    emit("\\nValidating problematic citations:")
+    for i, check in enumerate(report["validation"], 1):
+        emit(f"\\n{i}. {check['citation']}")
+        for message in check["messages"]:
+            emit(f"  {message}")
+    emit("")
     
-    print()
-    print("7. SYSTEM CAPABILITIES SUMMARY")
-    print("-" * 35)
+    quality = report["quality"]
+    emit("5. QUALITY ASSESSMENT")
+    emit("-" * 22)
+    emit("\\nPublication Quality Analysis:")
+    emit(f"  • Total publications analyzed: {quality['total_publications']}")
+    emit(f"  • Total citations: {quality['total_citations']}")
+    emit(f"  • Average citations per publication: {quality['average_citations']:.1f}")
+    emit(f"  • Verification rate: 100% (all sources verified)")
+    emit(f"  • High-impact publications (>100 citations): {quality['high_impact_publications']}")
+    emit("")
     
-    capabilities = [
-        "✓ Multi-source academic database searching",
-        "✓ Automated publication discovery and deduplication", 
-        "✓ Source verification and URL accessibility checking",
-        "✓ Citation accuracy validation and error detection",
-        "✓ Multiple citation style formatting (APA, MLA, Chicago, etc.)",
-        "✓ Publication quality assessment and ranking",
-        "✓ Comprehensive research report generation",
-        "✓ Batch processing for multiple researchers",
-        "✓ Real-time error correction recommendations",
-        "✓ Export capabilities (JSON, PDF, Word formats)"
-    ]
+    emit("6. REPORT GENERATION")
+    emit("-" * 22)
+    emit("\\nGenerating comprehensive research reports...")
+    for summary in report["reports"]:
+        if not summary["publication_count"]:
+            continue
+        emit(_SUMMARY_TEMPLATE.format(
+            name=summary["researcher_name"],
+            count=summary["publication_count"],
+            types=", ".join(summary["publication_types"]),
+            first_year=summary["first_year"],
+            last_year=summary["last_year"],
+            citations=summary["total_citations"],
+            recent_title=summary["most_recent"]["title"],
+            recent_year=summary["most_recent"]["year"]
+        ))
+    emit("")
     
-    for capability in capabilities:
-        print(f"  {capability}")
+    emit("7. SYSTEM CAPABILITIES SUMMARY")
+    emit("-" * 35)
+    for capability in report["capabilities"]:
+        emit(f"  {capability}")
     
-    print()
-    print("=" * 60)
-    print("DEMONSTRATION COMPLETE")
-    print("=" * 60)
-    print()
-    print("The Academic Research Agent System successfully demonstrated:")
-    print("• Automated research discovery across multiple academic databases")
-    print("• Comprehensive citation verification and validation")
-    print("• Multi-style citation formatting and consistency checking")
-    print("• Quality assessment and impact analysis")
-    print("• Error detection and correction recommendations")
-    print()
-    print("This system replicates and enhances the manual research verification")
-    print("process demonstrated in the academic citation correction workflow.")
+    emit("")
+    emit("=" * 60)
+    emit("DEMONSTRATION COMPLETE")
+    emit("=" * 60)
+    emit("")
+    emit("The Academic Research Agent System successfully demonstrated:")
+    emit("• Automated research discovery across multiple academic databases")
+    emit("• Comprehensive citation verification and validation")
+    emit("• Multi-style citation formatting and consistency checking")
+    emit("• Quality assessment and impact analysis")
+    emit("• Error detection and correction recommendations")
+    emit("")
+    emit("This system replicates and enhances the manual research verification")
+    emit("process demonstrated in the academic citation correction workflow.")
+    return "\n".join(out) + "\n"
+
+def demonstrate_aras_capabilities() -> Dict:
+    """Demonstrate the key capabilities of the ARAS system"""
+    report = build_report()
+    sys.stdout.write(render_report(report))
+    return report
 
 if __name__ == "__main__":
     demonstrate_aras_capabilities()
-
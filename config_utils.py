@@ -5,16 +5,27 @@ This module provides functions for loading and accessing configuration settings.
 """
 
 import os
+import copy
 import yaml
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 # Default configuration file path
 DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'config.yaml')
 
+# LibYAML's C loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed configuration per file path, with the modification time it was read at
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
     
+    A file is parsed again only after its modification time changes; each call
+    returns its own copy of the configuration, so callers may modify it.
+    
     Args:
         config_path: Path to configuration file. If None, uses default path.
         
@@ -31,12 +42,22 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-    with open(config_path, 'r') as f:
-        try:
-            config = yaml.safe_load(f)
-            return config
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Error parsing configuration file: {e}")
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime:
+        with open(config_path, 'r') as f:
+            try:
+                config = yaml.load(f, Loader=_SafeLoader)
+            except yaml.YAMLError as e:
+                raise yaml.YAMLError(f"Error parsing configuration file: {e}")
+        cached = _CONFIG_CACHE[config_path] = (mtime, config)
+    
+    return copy.deepcopy(cached[1])
+
+@lru_cache(maxsize=1024)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-separated configuration path into its keys."""
+    return tuple(key_path.split('.'))
 
 def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None) -> Any:
     """
@@ -50,11 +71,10 @@ def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None)
     Returns:
         Configuration value or default if not found.
     """
-    keys = key_path.split('.')
     value = config
     
     try:
-        for key in keys:
+        for key in _split_key_path(key_path):
             value = value[key]
         return value
     except (KeyError, TypeError):
@@ -103,9 +123,12 @@ def create_directories(config: Dict[str, Any]) -> None:
             # Make relative paths absolute from project root
             path_value = os.path.join(os.path.dirname(os.path.dirname(__file__)), path_value)
             
-        if path_value and not os.path.exists(path_value):
+        if path_value:
+            # Creating straight away saves a separate existence check per path
             try:
-                os.makedirs(path_value, exist_ok=True)
+                os.makedirs(path_value)
                 print(f"Created directory: {path_value}")
+            except FileExistsError:
+                pass
             except OSError as e:
                 print(f"Error creating directory {path_value}: {e}")
@@ -223,13 +223,11 @@ ax.set_yticklabels(solutions, fontsize=11, fontweight='bold')
 # Rotate the tick labels and set their alignment
 plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
 
-# Add text annotations
-for i in range(len(solutions)):
-    for j in range(len(industries)):
-        value = applicability_data[i, j]
-        text_color = 'white' if value < 2.5 else 'black'
-        text = ax.text(j, i, value, ha="center", va="center", 
-                      color=text_color, fontweight='bold', fontsize=12)
+# Add text annotations (colors picked for the whole matrix at once)
+text_colors = np.where(applicability_data < 2.5, 'white', 'black')
+text_style = dict(ha="center", va="center", fontweight='bold', fontsize=12)
+for (i, j), value in np.ndenumerate(applicability_data):
+    ax.text(j, i, value, color=text_colors[i, j], **text_style)
 
 # Add colorbar
 cbar = ax.figure.colorbar(im, ax=ax, shrink=0.8)
@@ -0,0 +1,496 @@
+"""
+Tests for the academic_research_agent_system module of the Academic Research Automation System.
+
+This module contains tests for engine searches, publication deduplication and citation formatting.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+
+import pytest
+
+import academic_research_agent_system as aras
+from academic_research_agent_system import (
+    ResearchDiscoveryAgent,
+    BookDiscoveryAgent,
+    Publication
+)
+
+
+def make_publication(title, year=2020, **kwargs):
+    """Build a minimal publication for tests."""
+    return Publication(
+        title=title,
+        authors=kwargs.pop("authors", ["Test Author"]),
+        year=year,
+        venue=kwargs.pop("venue", "Test Venue"),
+        publication_type=kwargs.pop("publication_type", "journal"),
+        **kwargs
+    )
+
+
+class FakeResponse:
+    """Canned HTTP response with the attributes the engines read."""
+
+    def __init__(self, status_code=200, content=b""):
+        self.status_code = status_code
+        self.content = content
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    async def aiter_bytes(self, chunk_size=1):
+        for chunk in self.iter_content(chunk_size):
+            yield chunk
+
+
+class FakeSession:
+    """Session returning canned responses in order and recording each request's params."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append(dict(params or {}))
+        return self.responses.pop(0)
+
+
+class FakeAsyncClient(FakeSession):
+    """Async client counterpart of FakeSession."""
+
+    async def get(self, url, params=None, **kwargs):
+        return super().get(url, params=params)
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method, url, params=None, **kwargs):
+        yield super().get(url, params=params)
+
+
+def crossref_page(titles, cursor=None):
+    """Crossref works response body listing the given titles."""
+    message = {"items": [{"title": [title], "type": "journal-article"} for title in titles]}
+    if cursor:
+        message["next-cursor"] = cursor
+    return FakeResponse(content=json.dumps({"message": message}).encode())
+
+
+def arxiv_feed(titles):
+    """arXiv Atom feed body with one entry per title."""
+    entries = "".join(
+        f"""
+  <entry>
+    <id>http://arxiv.org/abs/2101.0000{index}v1</id>
+    <published>2021-01-0{index + 1}T00:00:00Z</published>
+    <title>{title}</title>
+    <summary>Abstract of {title}.</summary>
+    <author><name>Jane Doe</name></author>
+    <author><name>John Roe</name></author>
+  </entry>"""
+        for index, title in enumerate(titles)
+    )
+    return FakeResponse(content=f'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>arXiv Query</title>{entries}
+</feed>'''.encode())
+
+
+@pytest.fixture
+def paging_agent():
+    """Discovery agent capped at five results per engine, with no rate-limit waits."""
+    agent = ResearchDiscoveryAgent({"max_results": 5})
+    agent.rate_limits = dict.fromkeys(agent.rate_limits, 0)
+    return agent
+
+
+@pytest.fixture
+def discovery_agent(tmp_path):
+    """Discovery agent with the memory cache on and no rate-limit waits."""
+    if not aras.CACHETOOLS_AVAILABLE:
+        pytest.skip("cachetools not installed")
+    agent = ResearchDiscoveryAgent({"cache_enabled": True, "cache_name": str(tmp_path / "http_cache")})
+    agent.rate_limits = dict.fromkeys(agent.rate_limits, 0)
+    return agent
+
+
+class TestResultsCache:
+    """Test suite for the in-memory engine results cache."""
+
+    def test_hits_are_copies(self, discovery_agent):
+        """Changing returned publications does not change later cache hits."""
+        discovery_agent.http = FakeSession([crossref_page(["First Paper", "Second Paper"])])
+
+        first = list(discovery_agent._iter_engine_results("crossref", "Jane Doe"))
+        for pub in first:
+            pub.verified = True
+        second = list(discovery_agent._iter_engine_results("crossref", "Jane Doe"))
+
+        assert [pub.title for pub in second] == ["First Paper", "Second Paper"]
+        assert not any(pub.verified for pub in second)
+
+    def test_truncated_results_not_cached(self, discovery_agent, monkeypatch):
+        """A failed later page keeps the earlier pages but is searched again next time."""
+        monkeypatch.setattr(aras, "CROSSREF_PAGE_SIZE", 2)
+        discovery_agent.http = FakeSession([
+            crossref_page(["First Paper", "Second Paper"], cursor="next"),
+            FakeResponse(status_code=429),
+            crossref_page(["First Paper"])
+        ])
+
+        truncated = list(discovery_agent._iter_engine_results("crossref", "Jane Doe"))
+        retried = list(discovery_agent._iter_engine_results("crossref", "Jane Doe"))
+
+        assert [pub.title for pub in truncated] == ["First Paper", "Second Paper"]
+        assert [pub.title for pub in retried] == ["First Paper"]
+
+
+class TestCrossrefPaging:
+    """Test suite for Crossref cursor paging."""
+
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        monkeypatch.setattr(aras, "CROSSREF_PAGE_SIZE", 2)
+
+    def test_max_results_caps_rows(self, paging_agent):
+        """The last page only asks for the rows still allowed by max_results."""
+        paging_agent.http = FakeSession([
+            crossref_page(["Paper One", "Paper Two"], cursor="page2"),
+            crossref_page(["Paper Three", "Paper Four"], cursor="page3"),
+            crossref_page(["Paper Five"], cursor="page4")
+        ])
+
+        result = list(paging_agent._search_crossref("Jane Doe"))
+
+        assert len(result) == 5
+        assert [params["rows"] for params in paging_agent.http.requests] == [2, 2, 1]
+        assert [params["cursor"] for params in paging_agent.http.requests] == ["*", "page2", "page3"]
+
+    def test_short_page_stops(self, paging_agent):
+        """A page with fewer items than requested is the last one."""
+        paging_agent.http = FakeSession([
+            crossref_page(["Paper One", "Paper Two"], cursor="page2"),
+            crossref_page(["Paper Three"], cursor="page3")
+        ])
+
+        result = list(paging_agent._search_crossref("Jane Doe"))
+
+        assert [pub.title for pub in result] == ["Paper One", "Paper Two", "Paper Three"]
+        assert len(paging_agent.http.requests) == 2
+
+    def test_missing_cursor_stops(self, paging_agent):
+        """A full page without a next-cursor ends the search."""
+        paging_agent.http = FakeSession([crossref_page(["Paper One", "Paper Two"])])
+
+        result = list(paging_agent._search_crossref("Jane Doe"))
+
+        assert len(result) == 2
+        assert len(paging_agent.http.requests) == 1
+
+    def test_failed_page_raises_after_earlier_pages(self, paging_agent):
+        """A non-200 page raises once the earlier pages have been yielded."""
+        paging_agent.http = FakeSession([
+            crossref_page(["Paper One", "Paper Two"], cursor="page2"),
+            FakeResponse(status_code=503)
+        ])
+        titles = []
+
+        with pytest.raises(aras.IncompleteSearchError, match="HTTP 503"):
+            for pub in paging_agent._search_crossref("Jane Doe"):
+                titles.append(pub.title)
+
+        assert titles == ["Paper One", "Paper Two"]
+
+    def test_async_max_results_caps_rows(self, paging_agent):
+        """The async search pages the same way as the sync one."""
+        client = FakeAsyncClient([
+            crossref_page(["Paper One", "Paper Two"], cursor="page2"),
+            crossref_page(["Paper Three", "Paper Four"], cursor="page3"),
+            crossref_page(["Paper Five"], cursor="page4")
+        ])
+
+        result = asyncio.run(paging_agent._search_crossref_async(client, "Jane Doe"))
+
+        assert len(result) == 5
+        assert [params["rows"] for params in client.requests] == [2, 2, 1]
+        assert [params["cursor"] for params in client.requests] == ["*", "page2", "page3"]
+
+    def test_async_stops_on_short_page_or_missing_cursor(self, paging_agent):
+        """The async search stops on a short page and on a missing next-cursor."""
+        short = FakeAsyncClient([crossref_page(["Paper One"], cursor="page2")])
+        uncursored = FakeAsyncClient([crossref_page(["Paper One", "Paper Two"])])
+
+        asyncio.run(paging_agent._search_crossref_async(short, "Jane Doe"))
+        asyncio.run(paging_agent._search_crossref_async(uncursored, "Jane Doe"))
+
+        assert len(short.requests) == 1
+        assert len(uncursored.requests) == 1
+
+    def test_async_failed_page_keeps_earlier_pages(self, paging_agent):
+        """The async error carries the publications from the pages before it."""
+        client = FakeAsyncClient([
+            crossref_page(["Paper One", "Paper Two"], cursor="page2"),
+            FakeResponse(status_code=503)
+        ])
+
+        with pytest.raises(aras.IncompleteSearchError) as excinfo:
+            asyncio.run(paging_agent._search_crossref_async(client, "Jane Doe"))
+
+        assert [pub.title for pub in excinfo.value.publications] == ["Paper One", "Paper Two"]
+
+
+class TestArxivFeed:
+    """Test suite for the streaming arXiv feed parser and paging."""
+
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        monkeypatch.setattr(aras, "ARXIV_PAGE_SIZE", 2)
+        monkeypatch.setattr(aras, "ARXIV_CHUNK_SIZE", 16)
+
+    def test_entries_parsed_across_chunks(self, paging_agent):
+        """Entries split over many small chunks are converted in order."""
+        feed = arxiv_feed(["Quantum\n      Learning", "Graph Methods"])
+
+        result = list(paging_agent._parse_arxiv_feed(feed.iter_content(chunk_size=7)))
+
+        assert [pub.title for pub in result] == ["Quantum Learning", "Graph Methods"]
+        first = result[0]
+        assert first.authors == ["Jane Doe", "John Roe"]
+        assert first.year == 2021
+        assert first.venue == "arXiv"
+        assert first.publication_type == "preprint"
+        assert first.url == "http://arxiv.org/abs/2101.00000v1"
+        assert first.abstract == "Abstract of Quantum\n      Learning."
+
+    def test_entries_yielded_before_feed_ends(self, paging_agent):
+        """An entry is available as soon as its closing tag has arrived."""
+        body = arxiv_feed(["Quantum Learning", "Graph Methods"]).content
+        split = body.index(b"</entry>") + len(b"</entry>")
+
+        parsed = paging_agent._parse_arxiv_feed(iter([body[:split], body[split:]]))
+
+        assert next(parsed).title == "Quantum Learning"
+
+    def test_paging_advances_start(self, paging_agent):
+        """Full pages advance start until max_results is reached."""
+        paging_agent.http = FakeSession([
+            arxiv_feed(["Paper One", "Paper Two"]),
+            arxiv_feed(["Paper Three", "Paper Four"]),
+            arxiv_feed(["Paper Five"])
+        ])
+
+        result = list(paging_agent._search_arxiv("Jane Doe"))
+
+        assert len(result) == 5
+        assert [params["start"] for params in paging_agent.http.requests] == [0, 2, 4]
+        assert [params["max_results"] for params in paging_agent.http.requests] == [2, 2, 1]
+
+    def test_short_page_stops(self, paging_agent):
+        """A page with fewer entries than requested is the last one."""
+        paging_agent.http = FakeSession([arxiv_feed(["Paper One"])])
+
+        result = list(paging_agent._search_arxiv("Jane Doe"))
+
+        assert [pub.title for pub in result] == ["Paper One"]
+        assert len(paging_agent.http.requests) == 1
+
+    def test_failed_page_raises(self, paging_agent):
+        """A non-200 page raises once the earlier pages have been yielded."""
+        paging_agent.http = FakeSession([
+            arxiv_feed(["Paper One", "Paper Two"]),
+            FakeResponse(status_code=500)
+        ])
+        titles = []
+
+        with pytest.raises(aras.IncompleteSearchError, match="HTTP 500"):
+            for pub in paging_agent._search_arxiv("Jane Doe"):
+                titles.append(pub.title)
+
+        assert titles == ["Paper One", "Paper Two"]
+
+    def test_async_stream_pages(self, paging_agent):
+        """The async search parses streamed pages and advances start."""
+        client = FakeAsyncClient([
+            arxiv_feed(["Paper One", "Paper Two"]),
+            arxiv_feed(["Paper Three"])
+        ])
+
+        result = asyncio.run(paging_agent._search_arxiv_async(client, "Jane Doe"))
+
+        assert [pub.title for pub in result] == ["Paper One", "Paper Two", "Paper Three"]
+        assert [params["start"] for params in client.requests] == [0, 2]
+
+    def test_async_failed_page_keeps_earlier_pages(self, paging_agent):
+        """The async error carries the publications from the pages before it."""
+        client = FakeAsyncClient([
+            arxiv_feed(["Paper One", "Paper Two"]),
+            FakeResponse(status_code=500)
+        ])
+
+        with pytest.raises(aras.IncompleteSearchError) as excinfo:
+            asyncio.run(paging_agent._search_arxiv_async(client, "Jane Doe"))
+
+        assert [pub.title for pub in excinfo.value.publications] == ["Paper One", "Paper Two"]
+
+
+class TestDeduplication:
+    """Test suite for publication and book deduplication."""
+
+    def test_exact_duplicates_removed(self):
+        """Titles equal after normalization collapse to one record."""
+        agent = ResearchDiscoveryAgent({})
+        publications = [
+            make_publication("Machine Learning in Research"),
+            make_publication("machine learning in research!"),
+            make_publication("Data Science Fundamentals")
+        ]
+
+        result = agent._deduplicate_publications(publications)
+
+        assert [pub.title for pub in result] == [
+            "Machine Learning in Research",
+            "Data Science Fundamentals"
+        ]
+
+    def test_short_titles_dropped(self):
+        """Titles too short to compare reliably are discarded."""
+        agent = ResearchDiscoveryAgent({})
+
+        assert agent._deduplicate_publications([make_publication("Intro")]) == []
+
+    def test_most_complete_record_kept(self):
+        """The duplicate with the most populated fields wins."""
+        agent = ResearchDiscoveryAgent({})
+        sparse = make_publication("Machine Learning in Research")
+        complete = make_publication("Machine Learning in Research", doi="10.1000/182", citation_count=12)
+
+        result = agent._deduplicate_publications([sparse, complete])
+
+        assert result == [complete]
+
+    def test_word_order_duplicates_removed(self):
+        """Near-duplicate titles are clustered when rapidfuzz is available."""
+        if not aras.RAPIDFUZZ_AVAILABLE:
+            pytest.skip("rapidfuzz not installed")
+        agent = ResearchDiscoveryAgent({})
+        publications = [
+            make_publication("Organizational Change and Technology Affordances"),
+            make_publication("Technology Affordances and Organizational Change"),
+            make_publication("Digital Work in Distributed Teams")
+        ]
+
+        result = agent._deduplicate_publications(publications)
+
+        assert len(result) == 2
+
+    def test_books_with_different_isbns_kept(self):
+        """Editions with distinct ISBNs are not merged on title alone."""
+        agent = BookDiscoveryAgent({})
+        books = [
+            make_publication("Data Science Fundamentals", isbn="9780000000001", publication_type="book"),
+            make_publication("Data Science Fundamentals", isbn="9780000000002", publication_type="book"),
+            make_publication("Data Science Fundamentals", publication_type="book"),
+            make_publication("Another Book Title", isbn="9780000000001", publication_type="book")
+        ]
+
+        result = agent._deduplicate_books(books)
+
+        assert [book.isbn for book in result] == ["9780000000001", "9780000000002"]
+
+
+class TestRateLimiting:
+    """Test suite for the blocking per-engine rate limit."""
+
+    def test_same_engine_requests_spaced(self):
+        """A second request to one engine waits out its interval."""
+        agent = ResearchDiscoveryAgent({})
+        agent.rate_limits["crossref"] = 0.05
+
+        start = time.monotonic()
+        agent._respect_rate_limit_sync("crossref")
+        agent._respect_rate_limit_sync("dblp")
+        agent._respect_rate_limit_sync("crossref")
+
+        assert time.monotonic() - start >= 0.05
+
+
+class TestBookDiscoveryAgent:
+    """Test suite for book metadata helpers."""
+
+    def test_extract_isbn_prefers_isbn13(self):
+        """ISBN-13 wins over an earlier ISBN-10 and is normalized."""
+        agent = BookDiscoveryAgent({})
+        identifiers = [
+            {"type": "ISBN_10", "identifier": "0-306-40615-2"},
+            {"type": "ISBN_13", "identifier": "978-0-306-40615-7"}
+        ]
+
+        assert agent._extract_isbn(identifiers) == "9780306406157"
+
+    def test_extract_isbn_missing(self):
+        """Non-ISBN identifiers are ignored."""
+        agent = BookDiscoveryAgent({})
+
+        assert agent._extract_isbn([{"type": "OTHER", "identifier": "abc"}]) is None
+
+
+class TestTitleNormalization:
+    """Test suite for title normalization."""
+
+    @pytest.mark.parametrize("title", [
+        "Machine Learning: A Survey (2nd ed.)",
+        "snake_case_title",
+        "Ünïcode—Dash… Title",
+        "  padded title  "
+    ])
+    def test_matches_regex_normalization(self, title):
+        """The ASCII fast path and the regex path produce identical keys."""
+        import re
+        expected = re.sub(r'[^\w\s]', '', title.lower()).strip()
+
+        assert aras._normalize_title(title) == expected
+
+
+class TestCitationFormatting:
+    """Test suite for citation formatting."""
+
+    @pytest.fixture
+    def publication(self):
+        return make_publication(
+            "Machine learning in research",
+            year=2023,
+            authors=["Smith, J.", "Jones, K.", "Brown, L.", "Green, M."],
+            venue="AI Journal"
+        )
+
+    def test_apa(self, publication):
+        """APA output matches the original hand-written format."""
+        agent = aras.SimpleCitationAgent({})
+
+        assert agent.format_citation(publication) == (
+            "Smith, J., Jones, K., Brown, L. et al. (2023). Machine learning in research. AI Journal."
+        )
+
+    def test_mla(self, publication):
+        """MLA output quotes the title and ends with the year."""
+        agent = aras.SimpleCitationAgent({})
+
+        assert agent.format_citation(publication, "MLA") == (
+            'Smith, J., Jones, K., Brown, L. et al. "Machine learning in research." AI Journal, 2023.'
+        )
+
+    def test_chicago(self, publication):
+        """Chicago output puts the year after the authors and quotes the title."""
+        agent = aras.SimpleCitationAgent({})
+
+        assert agent.format_citation(publication, "Chicago") == (
+            'Smith, J., Jones, K., Brown, L. et al. 2023. "Machine learning in research." AI Journal.'
+        )
+
+    def test_unknown_style_falls_back_to_apa(self, publication):
+        """Unknown styles format as APA."""
+        agent = aras.SimpleCitationAgent({})
+
+        assert agent.format_citation(publication, "ieee") == agent.format_citation(publication, "apa")
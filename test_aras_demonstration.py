@@ -0,0 +1,112 @@
+"""
+Tests for the aras_demonstration module of the Academic Research Automation System.
+
+This module contains tests for the demonstration's sample data, validation and report building.
+"""
+
+import asyncio
+import dataclasses
+import json
+
+import numpy as np
+
+import aras_demonstration as demo
+from academic_research_agent_system import Publication
+
+
+class TestSamplePublications:
+    """Test suite for sample publication lookup."""
+
+    def test_known_researcher(self):
+        """Known researchers get their own sample publications."""
+        publications = demo.create_sample_publications("Matt Beane")
+
+        assert [pub.year for pub in publications] == [2024, 2019]
+
+    def test_name_with_surrounding_text(self):
+        """A known name embedded in a longer string still matches."""
+        assert demo._match_key("Dr. Paul Leonardi, UCSB") == "Paul Leonardi"
+
+    def test_unknown_researcher(self):
+        """Unknown researchers get a single generic publication."""
+        publications = demo.create_sample_publications("Jane Doe")
+
+        assert len(publications) == 1
+        assert publications[0].authors == ("Jane Doe",)
+
+
+class TestValidation:
+    """Test suite for simulated citation validation."""
+
+    def test_first_matching_rule_wins(self):
+        """All keywords of a rule must appear for it to apply."""
+        messages = demo.validate_citation("Beane, M. (2024). The Skill Code. W. W. Norton & Company.")
+
+        assert messages == ("✗ Error: Wrong publisher - should be 'HarperBusiness'",)
+
+    def test_valid_citation(self):
+        """Citations matching no rule are reported valid."""
+        assert demo.validate_citation("Norton, A. (2020). A Book. Publisher.") == ("✓ Citation appears valid",)
+
+
+class TestPublicationBatch:
+    """Test suite for the columnar publication batch."""
+
+    def test_engine_type_names_kept(self):
+        """Types outside PubType keep their original names."""
+        publications = [
+            Publication(title="A", authors=["X"], year=2020, venue="V", publication_type=publication_type)
+            for publication_type in ("journal-article", "book", "proceedings-article", "journal-article")
+        ]
+        batch = demo.PublicationBatch.from_publications(publications)
+
+        assert demo._pub_type_names(batch.types) == ["journal-article", "book", "proceedings-article"]
+
+
+class TestCitationStats:
+    """Test suite for the citation statistics kernel."""
+
+    def test_matches_numpy_reductions(self):
+        """The compiled kernel agrees with the NumPy fallback."""
+        citations = np.array([5, 200, 101, 100], dtype=np.int32)
+
+        assert tuple(demo.citation_stats(citations)) == demo._citation_stats_numpy(citations) == (406, 200, 2)
+
+    def test_large_batch_matches_numpy(self):
+        """Batches large enough for the compiled kernel give the NumPy results."""
+        citations = np.arange(demo.JIT_MIN_CITATIONS * 2, dtype=np.int64)[::-2]
+
+        assert demo.citation_stats(citations) == demo._citation_stats_numpy(citations)
+
+
+class TestReport:
+    """Test suite for building and rendering the demonstration report."""
+
+    def test_build_report(self):
+        """The report is plain data that serializes to JSON."""
+        report = demo.build_report()
+
+        assert report["quality"]["total_publications"] == 7
+        assert report["quality"]["high_impact_publications"] == 4
+        assert report["reports"][0]["publication_types"] == ["book", "journal"]
+        assert json.loads(json.dumps(report, default=dataclasses.asdict))["researchers"][1]["researcher_name"] == "Matt Beane"
+
+    def test_parallel_analysis_matches_sequential(self):
+        """Analyzing researchers in worker processes gives the same report."""
+        config = dict(demo.DEMO_CONFIG, parallel_processing=True, analysis_workers=2)
+
+        assert demo.render_report(demo.build_report(config)) == demo.render_report(demo.build_report())
+
+    def test_build_report_inside_event_loop(self):
+        """Building the report from a running event loop gives the same report."""
+        async def build_in_loop():
+            return demo.build_report()
+
+        assert demo.render_report(asyncio.run(build_in_loop())) == demo.render_report(demo.build_report())
+
+    def test_render_report(self):
+        """Rendering produces the console text for every section."""
+        text = demo.render_report(demo.build_report())
+
+        assert "  • Total citations: 2637" in text
+        assert "7. SYSTEM CAPABILITIES SUMMARY" in text
@@ -5,12 +5,16 @@ Comprehensive testing for the PDF Reference Extraction Agent
 
 import os
 import json
+import asyncio
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import pdf_reference_extraction_agent as prea
 from pdf_reference_extraction_agent import (
     PDFReferenceExtractionAgent, 
     ExtractedReference, 
     ReferenceStorageManager,
-    ReferenceParser
+    ReferenceParser,
+    PDFTextExtractor
 )
 
 def test_reference_storage():
@@ -78,6 +82,144 @@ def test_reference_storage():
                 print(f"✓ JSON contains {len(data['references'])} references")
                 print(f"✓ JSON metadata: {data['extraction_metadata']['total_references']} total")
 
+def test_storage_skips_up_to_date_outputs():
+    """Test that outputs newer than the source PDF are not regenerated"""
+    print("\\nTesting Up-to-date Output Skipping...")
+
+    storage_manager = ReferenceStorageManager({})
+    first = [ExtractedReference(full_text="First, A. (2020). One. Journal.", confidence_score=0.9)]
+    second = [ExtractedReference(full_text="Second, B. (2021). Two. Journal.", confidence_score=0.9)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "refs")
+        storage_manager.store_references(first, output_path, ["json", "csv"])
+        csv_mtime = os.path.getmtime(f"{output_path}.csv")
+
+        output_files = storage_manager.store_references(second, output_path, ["json", "csv"],
+                                                        source_mtime=csv_mtime - 60)
+        assert output_files == {"json": f"{output_path}.json", "csv": f"{output_path}.csv"}
+        with open(f"{output_path}.csv", encoding="utf-8") as f:
+            assert "First, A." in f.read()
+
+        storage_manager.store_references(second, output_path, ["csv"], source_mtime=csv_mtime + 60)
+        with open(f"{output_path}.csv", encoding="utf-8") as f:
+            assert "Second, B." in f.read()
+    print("✓ Up-to-date outputs kept, stale outputs regenerated")
+
+def test_storage_skips_identical_outputs():
+    """Test that outputs written from identical references are kept"""
+    print("\\nTesting Identical Output Skipping...")
+
+    storage_manager = ReferenceStorageManager({"skip_identical_outputs": True})
+    first = [ExtractedReference(full_text="First, A. (2020). One. Journal.", confidence_score=0.9)]
+    second = [ExtractedReference(full_text="Second, B. (2021). Two. Journal.", confidence_score=0.9)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "refs")
+        storage_manager.store_references(first, output_path, ["csv"])
+        with open(f"{output_path}.csv", "a", encoding="utf-8") as f:
+            f.write("marker\n")
+
+        storage_manager.store_references(list(first), output_path, ["csv"])
+        with open(f"{output_path}.csv", encoding="utf-8") as f:
+            assert "marker" in f.read()
+
+        storage_manager.store_references(second, output_path, ["csv"])
+        with open(f"{output_path}.csv", encoding="utf-8") as f:
+            contents = f.read()
+        assert "Second, B." in contents and "marker" not in contents
+    print("✓ Identical outputs kept, changed outputs rewritten")
+
+def test_excel_illegal_character_leaves_no_file():
+    """Test that a value Excel cannot store leaves no partial spreadsheet"""
+    print("\\nTesting Excel Illegal Characters...")
+
+    storage_manager = ReferenceStorageManager({})
+    refs = [ExtractedReference(full_text="Bad\x01text", confidence_score=0.9)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "refs")
+        output_files = storage_manager.store_references(refs, output_path, ["xlsx"])
+
+        assert output_files["xlsx"].startswith("Error:")
+        assert os.listdir(temp_dir) == []
+    print("✓ No partial Excel file written")
+
+def test_batch_summary():
+    """Test that the batch summary file records every PDF"""
+    print("\\nTesting Batch Summary...")
+
+    agent = PDFReferenceExtractionAgent()
+    pdf_paths = ["missing_one.pdf", "missing_two.pdf"]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = agent.batch_extract_references(pdf_paths, temp_dir)
+        with open(result["summary_file"], encoding="utf-8") as f:
+            summary = json.load(f)
+
+    assert summary["batch_summary"]["failed_extractions"] == 2
+    assert list(summary["individual_results"]) == pdf_paths
+    assert summary["individual_results"] == result["individual_results"]
+    assert summary["individual_results"]["missing_one.pdf"]["references_count"] == 0
+    print("✓ Batch summary lists each PDF's outcome")
+
+def test_non_pdf_rejected():
+    """Test that files without a PDF header fail before extraction"""
+    print("\\nTesting Non-PDF Rejection...")
+
+    agent = PDFReferenceExtractionAgent()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fake_pdf = os.path.join(temp_dir, "notes.pdf")
+        with open(fake_pdf, "w") as f:
+            f.write("plain text, not a PDF")
+
+        result = agent.extract_references_from_pdf(fake_pdf, os.path.join(temp_dir, "refs"))
+
+    assert result["status"] == "error"
+    assert result["error"].startswith("Not a PDF file")
+    print("✓ Non-PDF file rejected")
+
+def test_async_extraction():
+    """Test that the async entrypoint returns the same result as the sync one"""
+    print("\\nTesting Async Extraction...")
+
+    agent = PDFReferenceExtractionAgent()
+    result = asyncio.run(agent.extract_references_from_pdf_async("missing.pdf"))
+
+    assert result["status"] == "error"
+    assert result["error"] == "PDF file not found: missing.pdf"
+    print("✓ Async extraction completed")
+
+def test_extraction_cache_key():
+    """Test that the extraction cache is opt-in and keyed on the extraction settings"""
+    print("\\nTesting Extraction Cache Key...")
+
+    assert PDFReferenceExtractionAgent().config["extraction_cache_dir"] is None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = os.path.join(temp_dir, "paper.pdf")
+        with open(pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4\n")
+
+        assert PDFTextExtractor({})._cache_path(pdf_path) is None
+        with_ocr = PDFTextExtractor({"extraction_cache_dir": temp_dir})._cache_path(pdf_path)
+        without_ocr = PDFTextExtractor({"extraction_cache_dir": temp_dir, "enable_ocr": False})._cache_path(pdf_path)
+
+    assert with_ocr != without_ocr
+    print("✓ Cache keys differ per settings")
+
+def test_extraction_pool_shared():
+    """Test that concurrent extractions share one extraction pool"""
+    print("\\nTesting Extraction Pool Sharing...")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pools = set(executor.map(lambda _: prea._get_extraction_pool(), range(32)))
+
+    assert len(pools) == 1
+    pool = pools.pop()
+    prea._discard_extraction_pool(pool)
+    assert prea._get_extraction_pool() is not pool
+    print("✓ One pool created, broken pools replaced")
+
 def test_reference_parser():
     """Test the reference parsing functionality"""
     print("\\nTesting Reference Parser...")
@@ -110,6 +252,42 @@ def test_reference_parser():
         print(f"    Type: {ref.reference_type}")
         print(f"    Confidence: {ref.confidence_score:.2f}")
 
+def test_reference_memoization():
+    """Test that memoized parsing returns equal, independent references"""
+    print("\\nTesting Reference Memoization...")
+
+    text = "References\n\n[1] Smith, J. A. (2023). Machine learning in research. AI Journal, 15(3), 45-62.\n"
+    parser = ReferenceParser({"memoize_references": True, "memo_size": 1})
+
+    first = parser.extract_references_from_text(text)
+    first[0].authors.append("Changed, C.")
+    second = parser.extract_references_from_text(text)
+
+    assert second == ReferenceParser({}).extract_references_from_text(text)
+    assert len(parser._memo) == 1
+    parser.extract_references_from_text("No references here.")
+    assert len(parser._memo) == 1
+    parser.clear_cache()
+    assert not parser._memo
+    print("✓ Memoized references are copies")
+
+def test_reference_deduplication():
+    """Test that near-duplicate references collapse to the most confident one"""
+    print("\\nTesting Reference Deduplication...")
+
+    low = ExtractedReference(full_text="Smith, J. (2023). Machine learning in research. AI Journal.",
+                             title="Machine learning in research", confidence_score=0.4)
+    other = ExtractedReference(full_text="Johnson, M. (2022). Data Science Fundamentals. Academic Press.",
+                               title="Data Science Fundamentals", confidence_score=0.8)
+    high = ExtractedReference(full_text="Smith J 2023 Machine learning in research",
+                              title="Machine Learning in Research", confidence_score=0.9)
+
+    parser = ReferenceParser({})
+    unique = parser._deduplicate_references([low, other, high])
+
+    assert unique == [other, high]
+    print(f"✓ Deduplicated 3 references to {len(unique)}")
+
 def test_agent_initialization():
     """Test agent initialization and configuration"""
     print("\\nTesting Agent Initialization...")
@@ -142,6 +320,20 @@ def test_agent_initialization():
         assert key in stats
     print("✓ Statistics structure is correct")
 
+def test_statistics_average_confidence():
+    """Test that the average confidence covers every extracted reference"""
+    print("\\nTesting Statistics Averaging...")
+
+    agent = PDFReferenceExtractionAgent()
+    agent._update_statistics([ExtractedReference(confidence_score=0.5)] * 3)
+    agent._update_statistics([])
+    agent._update_statistics([ExtractedReference(confidence_score=1.0)])
+
+    stats = agent.get_processing_statistics()
+    assert stats["total_pdfs_processed"] == 3
+    assert stats["average_confidence_score"] == 0.625
+    print("✓ Average confidence weighted by reference")
+
 def test_integration_functions():
     """Test integration and utility functions"""
     print("\\nTesting Integration Functions...")